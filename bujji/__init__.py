@@ -8,9 +8,29 @@ __author__  = "bujji Contributors"
 
 LOGO = "🦞"
 
-from bujji.config  import load_config, save_config, get_active_provider, workspace_path
-from bujji.agent   import AgentLoop, HeartbeatService, CronService
-from bujji.session import SessionManager
+# Public names are resolved lazily (PEP 562) so `import bujji` — and every
+# `from bujji.config import …` — doesn't drag in the agent, LLM and tools.
+_LAZY = {
+    "load_config":         "bujji.config",
+    "save_config":         "bujji.config",
+    "get_active_provider": "bujji.config",
+    "workspace_path":      "bujji.config",
+    "AgentLoop":           "bujji.agent",
+    "HeartbeatService":    "bujji.agent",
+    "CronService":         "bujji.agent",
+    "SessionManager":      "bujji.session",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module 'bujji' has no attribute '{name}'")
+    import importlib
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value   # cache — next access skips __getattr__
+    return value
+
 
 __all__ = [
     "LOGO", "__version__",
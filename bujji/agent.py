@@ -169,6 +169,7 @@ class AgentLoop:
         cfg:             dict,
         send_message_fn: Optional[Callable[[str], None]] = None,
         callbacks:       Optional[dict]                  = None,
+        http                                             = None,
     ):
         self.cfg      = cfg
         self.callbacks = callbacks or {}
@@ -190,6 +191,7 @@ class AgentLoop:
             model       = model,
             max_tokens  = defaults.get("max_tokens", 8192),
             temperature = defaults.get("temperature", 0.7),
+            http        = http,
         )
 
         # Tool registry with tool-level callbacks wired in
@@ -211,6 +213,14 @@ class AgentLoop:
             file=sys.stderr,
         )
 
+    def warmup(self) -> None:
+        """
+        Pay cold-start costs before the first run(): connect to the LLM
+        provider and load skills.  Meant for a background thread at startup.
+        """
+        self.llm.warmup()
+        build_system_prompt(self.cfg, self._skills_loader)
+
     def run(
         self,
         user_message: str,
@@ -4,7 +4,9 @@ Config loading, saving, defaults, and provider registry.
 """
 
 import copy
+import functools
 import json
+import os
 from pathlib import Path
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -114,14 +116,40 @@ POPULAR_MODELS = {
     ],
 }
 
+# Onboarding menus — formatted once at import, not on every prompt
+PROVIDER_LIST = tuple(PROVIDER_DEFAULTS)
+PROVIDER_MENU = "\n".join(
+    f"  {i:2}. {p:<12}  default model: {model}"
+    for i, (p, (_, model)) in enumerate(PROVIDER_DEFAULTS.items(), 1)
+)
+POPULAR_MODEL_MENUS = {
+    provider: "\n".join(
+        f"    • {m}{'  ← default' if m == PROVIDER_DEFAULTS.get(provider, ('', ''))[1] else ''}"
+        for m in models
+    )
+    for provider, models in POPULAR_MODELS.items()
+}
+
 # ─────────────────────────────────────────────────────────────────────────────
 #  LOAD / SAVE
 # ─────────────────────────────────────────────────────────────────────────────
 
 def load_config() -> dict:
-    """Load config from disk, deep-merging with defaults for missing keys."""
-    if not CONFIG_FILE.exists():
+    """
+    Load config from disk, deep-merging with defaults for missing keys.
+    The parsed file is cached until its mtime/size changes; every caller
+    still gets its own deep copy, safe to mutate.
+    """
+    try:
+        st = CONFIG_FILE.stat()
+    except FileNotFoundError:
         return copy.deepcopy(DEFAULT_CONFIG)
+    return copy.deepcopy(_load_merged(st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_merged(mtime_ns: int, size: int) -> dict:
+    """Parse + merge CONFIG_FILE.  Arguments are only the cache key."""
     with open(CONFIG_FILE, encoding="utf-8") as f:
         on_disk = json.load(f)
     merged = copy.deepcopy(DEFAULT_CONFIG)
@@ -130,10 +158,13 @@ def load_config() -> dict:
 
 
 def save_config(cfg: dict) -> None:
-    """Persist config to ~/.bujji/config.json."""
+    """Persist config to ~/.bujji/config.json (atomically — never half-written)."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+    tmp = CONFIG_FILE.with_name(CONFIG_FILE.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(cfg, f, indent=2)
+    os.replace(tmp, CONFIG_FILE)
+    _load_merged.cache_clear()   # don't trust mtime granularity for same-tick rewrites
 
 
 def _deep_merge(base: dict, override: dict) -> None:
@@ -184,4 +215,5 @@ def get_active_provider(cfg: dict):
 
 def workspace_path(cfg: dict) -> Path:
     ws = cfg["agents"]["defaults"].get("workspace", str(WORKSPACE_DEFAULT))
-    return Path(ws).expanduser()
\ No newline at end of file
+    return Path(ws).expanduser()
+
@@ -63,7 +63,9 @@ class DiscordChannel:
                         )
                         return agent.run(text, history=history, stream=False)
 
-                    result = await asyncio.get_event_loop().run_in_executor(None, run_agent)
+                    result, shared = await asyncio.get_event_loop().run_in_executor(
+                        None, self.mgr.coalesce, session_id, text, run_agent
+                    )
                     if result:
                         parts.append(result)
 
@@ -71,8 +73,9 @@ class DiscordChannel:
                     for chunk in [reply[i:i+2000] for i in range(0, len(reply), 2000)]:
                         await message.channel.send(chunk)
 
-                    self.mgr.append(session_id, "user",      text)
-                    self.mgr.append(session_id, "assistant", reply)
+                    if not shared:
+                        self.mgr.append(session_id, "user",      text)
+                        self.mgr.append(session_id, "assistant", reply)
 
                 except Exception as e:
                     await message.channel.send(f"⚠️ Error: {e}")
@@ -9,6 +9,7 @@ Key improvements:
 """
 from __future__ import annotations
 
+import queue
 import sys
 import threading
 import time
@@ -25,6 +26,8 @@ except ImportError:
 
 LOGO = "🦞"
 
+_WORKERS = 8   # concurrent message handlers (each one is an agent.run)
+
 class TelegramChannel:
 
     def __init__(self, token: str, allow_from: list, cfg: dict, mgr: "SessionManager"):
@@ -34,11 +37,15 @@ class TelegramChannel:
         self.mgr        = mgr
         self.offset     = 0
         self.base_url   = f"https://api.telegram.org/bot{token}"
+        self._jobs      = queue.Queue()
 
     def run(self) -> None:
         if not _HAS_REQUESTS:
             print("[ERROR] requests not installed: pip install requests", file=sys.stderr)
             return
+        # Fixed pool of daemon workers instead of a fresh OS thread per message
+        for _ in range(_WORKERS):
+            threading.Thread(target=self._worker, daemon=True).start()
         print("[INFO] Telegram channel started (long polling)", file=sys.stderr)
         while True:
             try:
@@ -74,12 +81,13 @@ class TelegramChannel:
                 self.send(chat_id, "⛔ Unauthorized.")
                 continue
             print(f"[Telegram] {from_id}: {text[:80]}", file=sys.stderr)
-            history = self.mgr.history(f"telegram:{chat_id}")
-            threading.Thread(
-                target=self._handle, args=(chat_id, text, history), daemon=True
-            ).start()
+            self._jobs.put((chat_id, text))
+
+    def _worker(self) -> None:
+        while True:
+            self._handle(*self._jobs.get())
 
-    def _handle(self, chat_id: str, text: str, history: list) -> None:
+    def _handle(self, chat_id: str, text: str) -> None:
         session_id = f"telegram:{chat_id}"
         parts: list[str] = []
 
@@ -87,9 +95,13 @@ class TelegramChannel:
             parts.append(content)
             self.send(chat_id, content)
 
+        def run_agent() -> str:
+            agent   = self.mgr.get(session_id, send_message_fn=send_msg)
+            history = self.mgr.history(session_id)   # at run time — not when queued
+            return agent.run(text, history=history, stream=False)
+
         try:
-            agent  = self.mgr.get(session_id, send_message_fn=send_msg)
-            result = agent.run(text, history=history, stream=False)
+            result, shared = self.mgr.coalesce(session_id, text, run_agent)
             if result:
                 parts.append(result)
 
@@ -97,8 +109,9 @@ class TelegramChannel:
             if result:
                 self.send(chat_id, result)
 
-            self.mgr.append(session_id, "user",      text)
-            self.mgr.append(session_id, "assistant", reply)
+            if not shared:
+                self.mgr.append(session_id, "user",      text)
+                self.mgr.append(session_id, "assistant", reply)
 
         except Exception as e:
             self.send(chat_id, f"⚠️ Error: {e}")
@@ -106,15 +119,19 @@ class TelegramChannel:
 
 # ── Setup wizard ──────────────────────────────────────────────────────────────
 
-def setup_telegram_interactive(cfg: dict) -> None:
+def setup_telegram_interactive(cfg: dict) -> bool:
+    """
+    Prompt for bot token + allow list and store them in cfg.  Only mutates
+    cfg — the caller saves it.  Returns True if cfg was changed.
+    """
     if not _HAS_REQUESTS:
         print("  ⚠️  requests not installed — pip install requests")
-        return
+        return False
 
     token = input("  Paste your bot token: ").strip()
     if not token:
         print("  [Skipped]")
-        return
+        return False
 
     print("  Verifying token…", end="", flush=True)
     try:
@@ -126,7 +143,7 @@ def setup_telegram_interactive(cfg: dict) -> None:
         else:
             print(f" ❌ {data.get('description')}")
             if input("  Continue anyway? (y/N): ").strip().lower() != "y":
-                return
+                return False
     except Exception as e:
         print(f" ⚠️  ({e}), continuing.")
 
@@ -145,3 +162,4 @@ def setup_telegram_interactive(cfg: dict) -> None:
         "allow_from": allow_from,
     }
     print(f"  ✅ Telegram configured (allow_from: {allow_from or 'everyone'})")
+    return True
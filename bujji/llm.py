@@ -6,11 +6,14 @@ LLMProvider — OpenAI-compatible /v1/chat/completions with:
               → decouples the LLM from the output channel (CLI / web UI / tests)
 • Exponential back-off retry: 2s → 4s → 8s on 429 / 5xx / connection errors
 • Anthropic auth handled transparently
+• One pooled requests.Session per process — keep-alive connections are
+  reused across turns and sessions instead of a TLS handshake per call
 """
 from __future__ import annotations
 
 import json
 import sys
+import threading
 import time
 from typing import Callable, Optional
 
@@ -24,6 +27,31 @@ try:
 except ImportError:
     _HAS_REQUESTS = False
 
+_POOL_CONNECTIONS = 16   # distinct hosts kept warm
+_POOL_MAXSIZE     = 64   # concurrent connections per host (gateway fan-out)
+
+_http      = None
+_http_lock = threading.Lock()
+
+def shared_session():
+    """
+    Process-wide requests.Session with a sized connection pool, created on
+    first use.  Retries stay in LLMProvider._post_with_retry, so the adapter
+    does none of its own.
+    """
+    global _http
+    if _http is None:
+        with _http_lock:
+            if _http is None:
+                from requests.adapters import HTTPAdapter
+                session = _requests.Session()
+                adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS,
+                                      pool_maxsize=_POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                session.mount("http://",  adapter)
+                _http = session
+    return _http
+
 class LLMProvider:
     """
     Thin wrapper around any OpenAI-compatible /v1/chat/completions endpoint.
@@ -32,6 +60,8 @@ class LLMProvider:
     ──────────
     token_cb : optional callable(str) — receives each streamed token.
                If None, tokens are printed to stdout (original CLI behaviour).
+    http     : optional requests.Session to send through.
+               Defaults to the process-wide shared_session().
     """
 
     def __init__(
@@ -42,6 +72,7 @@ class LLMProvider:
         model:       str,
         max_tokens:  int   = 8192,
         temperature: float = 0.7,
+        http                = None,
     ):
         self.name        = name
         self.api_key     = api_key
@@ -49,6 +80,7 @@ class LLMProvider:
         self.model       = model
         self.max_tokens  = max_tokens
         self.temperature = temperature
+        self._http       = http
 
     # ── Public ────────────────────────────────────────────────────────────
 
@@ -79,6 +111,20 @@ class LLMProvider:
             return self._collect_stream(resp, token_cb=token_cb)
         return resp.json()
 
+    def warmup(self) -> None:
+        """
+        Open a pooled connection to the API host ahead of the first chat() —
+        DNS + TCP + TLS are paid here, not on the user's first message.
+        Uses GET /models, so no tokens are spent.  Never raises.
+        """
+        if not _HAS_REQUESTS:
+            return
+        try:
+            http = self._http or shared_session()
+            http.get(f"{self.api_base}/models", headers=self._build_headers(), timeout=5).close()
+        except Exception:
+            pass
+
     # ── Private ───────────────────────────────────────────────────────────
 
     def _build_headers(self) -> dict:
@@ -105,10 +151,11 @@ class LLMProvider:
         return p
 
     def _post_with_retry(self, url, headers, payload, stream):
+        http     = self._http or shared_session()
         last_exc = None
         for attempt in range(_MAX_RETRIES + 1):
             try:
-                resp = _requests.post(
+                resp = http.post(
                     url, headers=headers, json=payload,
                     timeout=120, stream=stream,
                 )
@@ -138,6 +185,7 @@ class LLMProvider:
                 return resp
 
             last_exc = RuntimeError(f"API error {resp.status_code}: {resp.text[:200]}")
+            resp.close()   # hand the connection back to the pool before retrying
             if attempt < _MAX_RETRIES:
                 wait = _BACKOFF_BASE ** (attempt + 1)
                 print(
@@ -159,48 +207,49 @@ class LLMProvider:
         tool_calls_raw: dict[int, dict] = {}
         finish_reason:  Optional[str]   = None
 
-        for raw_line in response.iter_lines():
-            if not raw_line:
-                continue
-            line = raw_line.decode("utf-8") if isinstance(raw_line, bytes) else raw_line
-            if line.startswith("data: "):
-                line = line[6:]
-            if line == "[DONE]":
-                break
+        with response:   # release the pooled connection even on early [DONE]
+            for raw_line in response.iter_lines():
+                if not raw_line:
+                    continue
+                line = raw_line.decode("utf-8") if isinstance(raw_line, bytes) else raw_line
+                if line.startswith("data: "):
+                    line = line[6:]
+                if line == "[DONE]":
+                    break
 
-            try:
-                chunk = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+                try:
+                    chunk = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                for choice in chunk.get("choices", []):
+                    delta = choice.get("delta", {})
+
+                    token = delta.get("content")
+                    if token:
+                        full_content += token
+                        if token_cb:
+                            token_cb(token)
+                        else:
+                            print(token, end="", flush=True)
+
+                    for tc in delta.get("tool_calls", []):
+                        idx = tc.get("index", 0)
+                        if idx not in tool_calls_raw:
+                            tool_calls_raw[idx] = {
+                                "id": "", "type": "function",
+                                "function": {"name": "", "arguments": ""},
+                            }
+                        if tc.get("id"):
+                            tool_calls_raw[idx]["id"] = tc["id"]
+                        fn = tc.get("function", {})
+                        if fn.get("name"):
+                            tool_calls_raw[idx]["function"]["name"] += fn["name"]
+                        if fn.get("arguments"):
+                            tool_calls_raw[idx]["function"]["arguments"] += fn["arguments"]
 
-            for choice in chunk.get("choices", []):
-                delta = choice.get("delta", {})
-
-                token = delta.get("content")
-                if token:
-                    full_content += token
-                    if token_cb:
-                        token_cb(token)
-                    else:
-                        print(token, end="", flush=True)
-
-                for tc in delta.get("tool_calls", []):
-                    idx = tc.get("index", 0)
-                    if idx not in tool_calls_raw:
-                        tool_calls_raw[idx] = {
-                            "id": "", "type": "function",
-                            "function": {"name": "", "arguments": ""},
-                        }
-                    if tc.get("id"):
-                        tool_calls_raw[idx]["id"] = tc["id"]
-                    fn = tc.get("function", {})
-                    if fn.get("name"):
-                        tool_calls_raw[idx]["function"]["name"] += fn["name"]
-                    if fn.get("arguments"):
-                        tool_calls_raw[idx]["function"]["arguments"] += fn["arguments"]
-
-                if choice.get("finish_reason"):
-                    finish_reason = choice["finish_reason"]
+                    if choice.get("finish_reason"):
+                        finish_reason = choice["finish_reason"]
 
         if full_content and not token_cb:
             print()  # newline after stdout streaming
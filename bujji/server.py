@@ -180,7 +180,8 @@ class BujjiHandler(BaseHTTPRequestHandler):
         ws    = workspace_path(_cfg)
         tg    = _cfg.get("channels", {}).get("telegram", {})
         dc    = _cfg.get("channels", {}).get("discord",  {})
-        brave = _cfg.get("tools", {}).get("web", {}).get("search", {}).get("api_key", "")
+        search_cfg = ((_cfg.get("tools") or {}).get("web") or {}).get("search") or {}
+        brave = search_cfg.get("api_key", "")
         tools = []
         try:
             from bujji.tools import ToolRegistry
@@ -14,6 +14,11 @@ That means:
 SessionManager fixes all of this by mapping a session_id → AgentLoop
 and keeping those objects alive for the lifetime of the gateway process.
 
+History is persisted to ~/.bujji/sessions.db (SQLite, WAL mode) so it
+survives gateway restarts; only the last MAX_HISTORY messages of each
+session are kept, on disk and in memory.  Per-tab web UI sessions are
+memory-only.
+
 Usage
 ─────
 mgr = SessionManager(cfg)
@@ -26,10 +31,85 @@ mgr.append("telegram:123456789", "assistant", result)
 """
 from __future__ import annotations
 
+import sys
 import threading
-from typing import Callable, Optional
+import time
+from collections import deque
+from concurrent.futures import Future
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional
+
+from bujji.agent  import AgentLoop
+from bujji.config import CONFIG_DIR
+
+if TYPE_CHECKING:
+    import sqlite3
+
+_EPHEMERAL_PREFIXES = ("web:",)   # session ids kept in memory only
+
+def _open_db(path: Path) -> "sqlite3.Connection":
+    """
+    Open (creating if needed) the session history DB.  Falls back to an
+    in-memory DB — history just won't persist — if the file can't be used.
+    """
+    import sqlite3   # only paid by processes that actually touch history
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+    except (OSError, sqlite3.Error) as e:
+        print(f"[WARN] Session DB unavailable ({e}) — history will not persist", file=sys.stderr)
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS msgs (
+            id      INTEGER PRIMARY KEY,
+            sid     TEXT    NOT NULL,
+            ts      INTEGER NOT NULL,
+            role    TEXT    NOT NULL,
+            content TEXT    NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS ix_msgs_sid ON msgs (sid, id);
+    """)
+    return conn
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls.
 
-from bujji.agent import AgentLoop
+    While a call for `key` is in flight, other callers with the same key wait
+    for and share its result instead of running `fn` again.  The key is
+    forgotten the moment the call finishes, so a later call always runs
+    afresh — a finished answer is never replayed.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, Future] = {}
+        self._lock  = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """Return (result, shared) — shared=True if another caller's run was reused."""
+        with self._lock:
+            fut   = self._calls.get(key)
+            owner = fut is None
+            if owner:
+                fut = self._calls[key] = Future()
+        if not owner:
+            return fut.result(), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._forget(key)
+            fut.set_exception(e)
+            raise
+        self._forget(key)   # before resolving, so no new caller can pick it up
+        fut.set_result(result)
+        return result, False
+
+    def _forget(self, key: Hashable) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
 
 class SessionManager:
     """
@@ -44,11 +124,15 @@ class SessionManager:
 
     MAX_HISTORY = 40   # messages (20 turns)
 
-    def __init__(self, cfg: dict):
+    def __init__(self, cfg: dict, db_path: Optional[Path] = None, http=None):
         self.cfg      = cfg
+        self.http     = http   # requests.Session shared by every agent (None → llm.shared_session())
         self._agents:  dict[str, AgentLoop]   = {}
-        self._history: dict[str, list]        = {}
+        self._history: dict[str, deque]       = {}   # in-memory window over the DB
         self._lock = threading.Lock()
+        self._db_path = db_path or CONFIG_DIR / "sessions.db"
+        self._conn    = None   # opened on first history access — one-shot runs never pay for it
+        self._flights = SingleFlight()
 
     # ── Agents ────────────────────────────────────────────────────────────
 
@@ -65,6 +149,7 @@ class SessionManager:
                     self.cfg,
                     send_message_fn = send_message_fn,
                     callbacks       = callbacks or {},
+                    http            = self.http,
                 )
             return self._agents[session_id]
 
@@ -82,30 +167,90 @@ class SessionManager:
         with self._lock:
             self._agents.pop(session_id, None)
             self._history.pop(session_id, None)
+            self._delete_rows(session_id)
+
+    def coalesce(self, session_id: str, prompt: str, fn: Callable[[], str]) -> tuple[str, bool]:
+        """
+        Run fn() for (session_id, prompt), sharing the result with any identical
+        request already in flight (e.g. a double-sent message or a redelivered
+        update).  Returns (result, shared); callers that got shared=True should
+        skip appending the turn to history — the original caller does that.
+        """
+        return self._flights.do((session_id, prompt), fn)
 
     # ── History ───────────────────────────────────────────────────────────
 
     def history(self, session_id: str) -> list:
         """Return a copy of the message history for this session."""
         with self._lock:
-            return list(self._history.get(session_id, []))
+            return list(self._window(session_id))
 
     def append(self, session_id: str, role: str, content: str) -> None:
         """Append one message to the session history (auto-trims to MAX_HISTORY)."""
         with self._lock:
-            hist = self._history.setdefault(session_id, [])
-            hist.append({"role": role, "content": content})
-            if len(hist) > self.MAX_HISTORY:
-                # Keep system message if present, then trim oldest turns
-                if hist and hist[0]["role"] == "system":
-                    self._history[session_id] = [hist[0]] + hist[-(self.MAX_HISTORY - 1):]
-                else:
-                    self._history[session_id] = hist[-self.MAX_HISTORY:]
+            hist = self._window(session_id)
+            if self._persists(session_id):
+                # Disk first: if the commit fails, memory is left untouched too
+                db = self._db()
+                try:
+                    with db:
+                        db.execute(
+                            "INSERT INTO msgs (sid, ts, role, content) VALUES (?, ?, ?, ?)",
+                            (session_id, time.time_ns(), role, content),
+                        )
+                        # Only the last MAX_HISTORY rows are ever read back — drop the rest
+                        db.execute(
+                            "DELETE FROM msgs WHERE sid = ? AND id <= ("
+                            "  SELECT id FROM msgs WHERE sid = ? ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                            (session_id, session_id, self.MAX_HISTORY),
+                        )
+                except db.Error as e:
+                    print(f"[WARN] Could not save history for {session_id}: {e}", file=sys.stderr)
+                    return
+            if len(hist) == self.MAX_HISTORY and hist[0]["role"] == "system":
+                # Keep system message if present, then drop the oldest turn
+                system = hist.popleft()
+                hist.popleft()
+                hist.appendleft(system)
+            hist.append({"role": role, "content": content})   # deque evicts oldest
 
     def clear(self, session_id: str) -> None:
         """Wipe history for a session without destroying the agent."""
         with self._lock:
-            self._history[session_id] = []
+            self._history[session_id] = deque(maxlen=self.MAX_HISTORY)
+            self._delete_rows(session_id)
+
+    def _window(self, session_id: str) -> deque:
+        """In-memory history for session_id, loaded from the DB on first use.  Caller holds _lock."""
+        hist = self._history.get(session_id)
+        if hist is None:
+            rows = self._db().execute(
+                "SELECT role, content FROM msgs WHERE sid = ? ORDER BY id DESC LIMIT ?",
+                (session_id, self.MAX_HISTORY),
+            ).fetchall() if self._persists(session_id) else []
+            hist = deque(
+                ({"role": role, "content": content} for role, content in reversed(rows)),
+                maxlen=self.MAX_HISTORY,
+            )
+            self._history[session_id] = hist
+        return hist
+
+    def _db(self) -> "sqlite3.Connection":
+        """The history DB connection, opened on first use.  Caller holds _lock."""
+        if self._conn is None:
+            self._conn = _open_db(self._db_path)
+        return self._conn
+
+    def _persists(self, session_id: str) -> bool:
+        """Web UI ids are random per page load — never resumable, so memory only."""
+        return not session_id.startswith(_EPHEMERAL_PREFIXES)
+
+    def _delete_rows(self, session_id: str) -> None:
+        if not self._persists(session_id):
+            return
+        db = self._db()
+        with db:
+            db.execute("DELETE FROM msgs WHERE sid = ?", (session_id,))
 
     def sessions(self) -> list[str]:
         """Return list of active session IDs."""
@@ -0,0 +1,45 @@
+"""
+bujji/tool_cache.py
+On-disk cache of the tool schema list, so `status` can list tools without
+importing bujji.tools (whose __init__ loads every tool module).  Stdlib only.
+"""
+
+import json
+import os
+from pathlib import Path
+
+TOOLS_DIR   = Path(__file__).parent / "tools"
+TOOLS_CACHE = Path.home() / ".cache" / "bujji" / "tools.json"
+
+
+def _tools_key() -> list:
+    """(name, mtime_ns, size) of every tool source file — changes on any edit."""
+    with os.scandir(TOOLS_DIR) as it:
+        return sorted(
+            [e.name, e.stat().st_mtime_ns, e.stat().st_size]
+            for e in it if e.name.endswith(".py")
+        )
+
+
+def load_tool_schema():
+    """Cached tool schema list, or None if missing or the tools have changed."""
+    try:
+        data = json.loads(TOOLS_CACHE.read_text(encoding="utf-8"))
+        if data.get("key") == _tools_key():
+            return data["schema"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def save_tool_schema(schema: list) -> None:
+    """Persist the tool schema list for load_tool_schema().  Best-effort."""
+    try:
+        if load_tool_schema() == schema:
+            return
+        TOOLS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = TOOLS_CACHE.with_name(TOOLS_CACHE.name + ".tmp")
+        tmp.write_text(json.dumps({"key": _tools_key(), "schema": schema}), encoding="utf-8")
+        os.replace(tmp, TOOLS_CACHE)
+    except OSError:
+        pass
@@ -13,7 +13,7 @@ from __future__ import annotations
 
 import importlib
 import inspect
-import pkgutil
+import os
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -114,12 +114,7 @@ class ToolContext:
         if len(parts) != 2:
             raise ValueError(f"cred() path must be 'service.key', got: '{dotpath}'")
         service, key = parts
-        value = (
-            self.cfg
-                .get("tools", {})
-                .get(service, {})
-                .get(key, "")
-        )
+        value = self._service_cfg(service).get(key, "")
         if not value and required:
             raise ToolCredentialError(
                 f"[{service}] '{key}' not configured.\n"
@@ -137,7 +132,11 @@ class ToolContext:
         keys = _ctx.creds("gmail")
         # → {"access_token": "...", "refresh_token": "...", ...}
         """
-        return dict(self.cfg.get("tools", {}).get(service, {}))
+        return dict(self._service_cfg(service))
+
+    def _service_cfg(self, service: str) -> dict:
+        """cfg["tools"][service], or {} — without allocating throwaway dicts."""
+        return (self.cfg.get("tools") or {}).get(service) or {}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -314,7 +313,12 @@ def register_tool(
                 "parameters":  schema_dict,
             },
         }
-        _REGISTRY[fn.__name__] = (fn, schema)
+        # Resolve _ctx injection once here, not on every call()
+        if "_ctx" in inspect.signature(fn).parameters:
+            invoker = lambda args, ctx, _fn=fn: _fn(**args, _ctx=ctx)
+        else:
+            invoker = lambda args, ctx, _fn=fn: _fn(**args)
+        _REGISTRY[fn.__name__] = (fn, schema, invoker)
         return fn
     return decorator
 
@@ -323,35 +327,45 @@ def register_tool(
 #  Global registry
 # ─────────────────────────────────────────────────────────────────────────────
 
-_REGISTRY:      dict[str, tuple[Callable, dict]] = {}
-_MODULE_MTIMES: dict[str, float]                 = {}
+_REGISTRY:      dict[str, tuple[Callable, dict, Callable]] = {}
+_MODULE_MTIMES: dict[str, float]                           = {}
+_SKIP_FILES = ("__init__.py", "base.py", "TEMPLATE.py")
 
 
-def _autodiscover(tools_pkg_path: Path, pkg_name: str) -> None:
+def _autodiscover(tools_pkg_path: Path, pkg_name: str) -> bool:
     """
     Import (or reload) every *.py module in tools/ so @register_tool
     decorators fire.  Skips unchanged files via mtime for performance.
+    Returns True if any module was (re)loaded.
     """
-    for _, module_name, _ in pkgutil.iter_modules([str(tools_pkg_path)]):
-        if module_name in ("base", "TEMPLATE"):
+    changed = False
+    with os.scandir(tools_pkg_path) as it:
+        entries = sorted(it, key=lambda e: e.name)   # stable registration order
+
+    for entry in entries:
+        name = entry.name
+        if not name.endswith(".py") or name in _SKIP_FILES:
             continue
 
-        full_name = f"{pkg_name}.{module_name}"
-        mod_file  = tools_pkg_path / f"{module_name}.py"
-        mtime     = mod_file.stat().st_mtime if mod_file.exists() else 0.0
+        module_name = name[:-3]
+        full_name   = f"{pkg_name}.{module_name}"
+        mtime       = entry.stat().st_mtime
 
-        if full_name in sys.modules and _MODULE_MTIMES.get(full_name) == mtime:
+        mod = sys.modules.get(full_name)
+        if mod is not None and _MODULE_MTIMES.get(full_name) == mtime:
             continue  # unchanged — skip
 
         try:
-            if full_name in sys.modules:
-                importlib.reload(sys.modules[full_name])
+            if mod is not None:
+                importlib.reload(mod)
                 print(f"[INFO] Hot-reloaded tool module: {module_name}", file=sys.stderr)
             else:
                 importlib.import_module(full_name)
             _MODULE_MTIMES[full_name] = mtime
+            changed = True
         except Exception as e:
             print(f"[WARN] Could not load tool module '{full_name}': {e}", file=sys.stderr)
+    return changed
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -390,7 +404,7 @@ class ToolRegistry:
     def schema(self) -> list[dict]:
         """Return OpenAI tool-call schema list. Triggers hot-reload check."""
         self._refresh()
-        return [schema for _, schema in _REGISTRY.values()]
+        return [schema for _, schema, _ in _REGISTRY.values()]
 
     def call(self, name: str, args: dict) -> str:
         """
@@ -399,25 +413,22 @@ class ToolRegistry:
         """
         self._refresh()
 
-        if name not in _REGISTRY:
+        try:
+            fn, _, invoker = _REGISTRY[name]
+        except KeyError:
             available = ", ".join(_REGISTRY) or "(none)"
             return (
                 f"[TOOL ERROR] Unknown tool: '{name}'.\n"
                 f"Available tools: {available}"
             )
 
-        fn, _  = _REGISTRY[name]
-        ctx    = self._make_ctx()
+        ctx = self._make_ctx()
 
         if ctx.on_tool_start:
             ctx.on_tool_start(name, args)
 
-        call_args = dict(args)
-        if "_ctx" in inspect.signature(fn).parameters:
-            call_args["_ctx"] = ctx
-
         try:
-            raw = fn(**call_args)
+            raw = invoker(args, ctx)
         except ToolCredentialError as e:
             raw = str(e)
         except TypeError as e:
@@ -449,7 +460,9 @@ class ToolRegistry:
         return output
 
     def _refresh(self) -> None:
-        _autodiscover(self._pkg_path, self._pkg_name)
+        if _autodiscover(self._pkg_path, self._pkg_name):
+            from bujji.tool_cache import save_tool_schema
+            save_tool_schema([schema for _, schema, _ in _REGISTRY.values()])
 
     def _make_ctx(self) -> ToolContext:
         return ToolContext(
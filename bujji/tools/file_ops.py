@@ -10,10 +10,11 @@ Changes vs v1:
 """
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
 
-from bujji.tools.base import ToolContext, register_tool
+from bujji.tools.base import ToolContext, ToolRegistry, register_tool
 
 # ── Path helper ───────────────────────────────────────────────────────────────
 
@@ -39,9 +40,28 @@ def _safe_path(path_str: str, ctx: ToolContext) -> Path:
 
 def _atomic_write(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp = path.parent / (path.name + ".tmp")
     tmp.write_text(content, encoding="utf-8")
-    tmp.replace(path)
+    os.replace(tmp, path)
+
+def _read_head_tail(path: Path, size: int, limit: int) -> str:
+    """
+    Read only the first 75% / last 25% of a `limit`-char budget from a large
+    file, so megabytes are never decoded just to be truncated by ToolRegistry.
+    """
+    budget     = max(limit - 80, 0)         # leave room for the omission marker
+    head_bytes = int(budget * 0.75)
+    tail_bytes = budget - head_bytes
+    with path.open("rb") as f:
+        head = f.read(head_bytes)
+        f.seek(-tail_bytes, 2)
+        tail = f.read(tail_bytes)
+    skipped = size - head_bytes - tail_bytes
+    return (
+        head.decode("utf-8", errors="replace")
+        + f"\n\n[… {skipped:,} bytes omitted …]\n\n"
+        + tail.decode("utf-8", errors="replace")
+    )
 
 # ── Tools ─────────────────────────────────────────────────────────────────────
 
@@ -69,6 +89,12 @@ def read_file(path: str, _ctx: ToolContext = None) -> str:
     if p.is_dir():
         return f"[ERROR] '{p}' is a directory — use list_files to inspect it."
     try:
+        limit = _ctx.cfg["agents"]["defaults"].get(
+            "max_tool_output_chars", ToolRegistry.DEFAULT_MAX_OUTPUT
+        )
+        size = p.stat().st_size
+        if size > limit * 4:   # 4× margin for multi-byte UTF-8
+            return _read_head_tail(p, size, limit)
         text = p.read_text(encoding="utf-8", errors="replace")
         return text if text else "(file is empty)"
     except Exception as e:
@@ -10,6 +10,8 @@ Safe USER.md memory.  Key improvements over v1:
 from __future__ import annotations
 
 import datetime
+import os
+import shutil
 from pathlib import Path
 
 from bujji.tools.base import ToolContext, register_tool
@@ -19,17 +21,22 @@ from bujji.tools.base import ToolContext, register_tool
 def _user_md_path(ctx: ToolContext) -> Path:
     return ctx.workspace / "USER.md"
 
-def _atomic_write(path: Path, content: str) -> None:
-    """Write content atomically: temp file → rename.  Cross-platform safe."""
-    tmp = path.with_suffix(".tmp")
+def _write_with_backup(path: Path, content: str) -> None:
+    """
+    Atomically replace path with content, keeping the old file as <name>.bak.
+    The backup is a hard link to the old file (O(1), no copy), so USER.md
+    exists at every instant — readers never see it missing.
+    """
+    tmp = path.parent / (path.name + ".tmp")   # USER.md → USER.md.tmp
+    bak = path.parent / (path.name + ".bak")   # USER.md → USER.md.bak
     tmp.write_text(content, encoding="utf-8")
-    tmp.replace(path)   # atomic on POSIX; best-effort on Windows
-
-def _backup(path: Path) -> None:
-    """Copy path → path.bak before overwriting."""
     if path.exists():
-        bak = path.with_suffix(".bak")
-        bak.write_bytes(path.read_bytes())
+        bak.unlink(missing_ok=True)
+        try:
+            os.link(path, bak)
+        except (AttributeError, OSError):   # no hard links (e.g. FAT, some network FS)
+            shutil.copy2(path, bak)
+    os.replace(tmp, path)   # atomic on POSIX; best-effort on Windows
 
 # ── Tools ─────────────────────────────────────────────────────────────────────
 
@@ -72,14 +79,12 @@ def read_user_memory(_ctx: ToolContext = None) -> str:
 )
 def append_user_memory(new_facts: str, _ctx: ToolContext = None) -> str:
     path    = _user_md_path(_ctx)
-    _backup(path)
-
     existing = path.read_text(encoding="utf-8").rstrip() if path.exists() else ""
     ts       = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
     entry    = f"\n\n<!-- updated {ts} -->\n{new_facts.strip()}"
     updated  = existing + entry
 
-    _atomic_write(path, updated)
+    _write_with_backup(path, updated)
     return f"Memory updated (+{len(new_facts)} chars). Total: {len(updated)} chars."
 
 @register_tool(
@@ -105,6 +110,5 @@ def append_user_memory(new_facts: str, _ctx: ToolContext = None) -> str:
 )
 def update_user_memory(content: str, _ctx: ToolContext = None) -> str:
     path = _user_md_path(_ctx)
-    _backup(path)
-    _atomic_write(path, content.strip())
+    _write_with_backup(path, content.strip())
     return f"USER.md replaced ({len(content)} chars). Backup saved to USER.md.bak."
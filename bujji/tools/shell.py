@@ -4,10 +4,157 @@ Shell execution with clean output, proper exit codes, and safe defaults.
 """
 from __future__ import annotations
 
+import functools
+import os
+import select
+import signal
 import subprocess
+import threading
+import time
+from pathlib import Path
 
 from bujji.tools.base import ToolContext, register_tool
 
+# Output capture is bounded: keep the first/last N bytes of each stream and
+# drop the middle, so a noisy command can't balloon memory.
+_CAPTURE_HEAD = 128 * 1024
+_CAPTURE_TAIL = 128 * 1024
+
+# Linux pipes hold 64 KiB — read in matching chunks instead of 4–8 KiB ones.
+_PIPE_CHUNK = 65536
+
+# ── Bounded capture ───────────────────────────────────────────────────────────
+
+class _Capture:
+    """Head + tail byte buffer for one output stream."""
+
+    def __init__(self):
+        self.head    = bytearray()
+        self.tail    = bytearray()
+        self.dropped = 0
+
+    def feed(self, chunk: bytes) -> None:
+        room = _CAPTURE_HEAD - len(self.head)
+        if room > 0:
+            self.head += chunk[:room]
+            chunk = chunk[room:]
+        if chunk:
+            self.tail += chunk
+            excess = len(self.tail) - _CAPTURE_TAIL
+            if excess > 0:
+                del self.tail[:excess]
+                self.dropped += excess
+
+    def text(self) -> str:
+        if not self.dropped:
+            # Nothing cut — decode as one buffer so a character straddling
+            # the head/tail boundary survives intact
+            return bytes(self.head + self.tail).decode("utf-8", errors="replace")
+        head = self.head.decode("utf-8", errors="replace")
+        tail = self.tail.decode("utf-8", errors="replace")
+        return f"{head}\n[… {self.dropped:,} bytes omitted …]\n{tail}"
+
+@functools.lru_cache(maxsize=32)
+def _resolved(path: Path) -> Path:
+    """Path.resolve() walks the tree with readlink/stat — do it once per workspace."""
+    return path.resolve()
+
+def _kill_tree(proc: subprocess.Popen) -> None:
+    """Kill the shell and everything it spawned (its own process group on POSIX)."""
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)   # pgid == pid via start_new_session
+        except ProcessLookupError:
+            pass
+    else:
+        proc.kill()
+    proc.wait()
+
+def _open_pidfd(pid: int) -> int | None:
+    """pidfd for `pid` (Linux ≥ 5.3, Python ≥ 3.9), or None if unsupported."""
+    try:
+        return os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        return None
+
+def _collect_poll(proc: subprocess.Popen, caps: dict, timeout: float) -> bool:
+    """
+    Drain proc's pipes into their _Capture with one poll() loop, then reap
+    the process.  Returns False if `timeout` expires first.
+
+    Where available, a pidfd is polled alongside the pipes so process exit
+    is seen directly: once it fires we only drain what is already buffered
+    instead of waiting for EOF a backgrounded grandchild may never send.
+    """
+    deadline = time.monotonic() + timeout
+    by_fd    = {pipe.fileno(): (pipe, cap) for pipe, cap in caps.items()}
+    poller   = select.poll()
+    for fd in by_fd:
+        poller.register(fd, select.POLLIN | select.POLLHUP)
+    pidfd = _open_pidfd(proc.pid)
+    if pidfd is not None:
+        poller.register(pidfd, select.POLLIN)
+    exited = False
+
+    try:
+        while by_fd:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            events = poller.poll(0 if exited else remaining * 1000)
+            if exited and not events:
+                break   # process gone and nothing left buffered
+            for fd, _ in events:
+                if fd == pidfd:
+                    poller.unregister(pidfd)
+                    exited = True
+                    continue
+                pipe, cap = by_fd[fd]
+                chunk = os.read(fd, _PIPE_CHUNK)
+                if chunk:
+                    cap.feed(chunk)
+                else:   # EOF
+                    poller.unregister(fd)
+                    pipe.close()
+                    del by_fd[fd]
+    finally:
+        for pipe, _ in by_fd.values():
+            pipe.close()
+        if pidfd is not None:
+            os.close(pidfd)
+
+    try:
+        proc.wait(timeout=max(deadline - time.monotonic(), 0))
+    except subprocess.TimeoutExpired:
+        return False
+    return True
+
+def _pump(pipe, cap: _Capture) -> None:
+    """Reader thread: drain pipe into cap until EOF, then close it."""
+    with pipe:
+        fd = pipe.fileno()
+        while True:
+            chunk = os.read(fd, _PIPE_CHUNK)
+            if not chunk:
+                break
+            cap.feed(chunk)
+
+def _collect_threads(proc: subprocess.Popen, caps: dict, timeout: float) -> bool:
+    """Fallback for platforms without poll() on pipes (Windows): one reader thread per pipe."""
+    readers = [
+        threading.Thread(target=_pump, args=(pipe, cap), daemon=True)
+        for pipe, cap in caps.items()
+    ]
+    for t in readers:
+        t.start()
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return False
+    for t in readers:
+        t.join(timeout=1)   # a background grandchild may still hold the pipe open
+    return True
+
 @register_tool(
     description=(
         "Execute a shell command on the local system and return combined stdout + stderr. "
@@ -35,28 +182,36 @@ from bujji.tools.base import ToolContext, register_tool
                     "Use '.' to keep the workspace root."
                 ),
             },
+            "capture_stderr": {
+                "type":        "boolean",
+                "description": "Include stderr in the result (default: true). Set false to discard it.",
+            },
         },
     },
 )
 def exec(
-    command: str,
-    timeout: int = 30,
-    workdir: str = ".",
-    _ctx:    ToolContext = None,
+    command:        str,
+    timeout:        int         = 30,
+    workdir:        str         = ".",
+    capture_stderr: bool        = True,
+    _ctx:           ToolContext = None,
 ) -> str:
     workspace = _ctx.workspace if _ctx else None
     restrict  = _ctx.restrict  if _ctx else False
 
     # Determine cwd
     if workspace:
-        from pathlib import Path
-        cwd_path = (workspace / workdir).resolve()
-        if restrict:
-            # Refuse paths outside workspace
-            try:
-                cwd_path.relative_to(workspace.resolve())
-            except ValueError:
-                return f"[TOOL ERROR] workdir '{workdir}' is outside the workspace."
+        ws_root = _resolved(workspace)
+        if workdir in ("", "."):
+            cwd_path = ws_root
+        else:
+            cwd_path = (workspace / workdir).resolve()
+            if restrict:
+                # Refuse paths outside workspace
+                try:
+                    cwd_path.relative_to(ws_root)
+                except ValueError:
+                    return f"[TOOL ERROR] workdir '{workdir}' is outside the workspace."
         cwd = str(cwd_path)
     else:
         cwd = None
@@ -65,26 +220,43 @@ def exec(
     timeout = max(1, min(int(timeout), 300))
 
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             command,
             shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
             cwd=cwd,
+            bufsize=_PIPE_CHUNK,
+            start_new_session=True,   # own process group → timeout kills grandchildren too
         )
-    except subprocess.TimeoutExpired:
-        return f"[TIMEOUT] Command killed after {timeout}s:\n  {command}"
     except Exception as e:
         return f"[ERROR] Could not run command: {e}"
 
+    out, err = _Capture(), _Capture()
+    caps     = {proc.stdout: out}
+    if proc.stderr is not None:
+        caps[proc.stderr] = err
+    collect  = _collect_poll if hasattr(select, "poll") else _collect_threads
+    try:
+        finished = collect(proc, caps, timeout)
+    except BaseException:
+        # Own session → Ctrl+C never reaches the child; kill it ourselves
+        _kill_tree(proc)
+        raise
+    if not finished:
+        _kill_tree(proc)
+        return f"[TIMEOUT] Command killed after {timeout}s:\n  {command}"
+    returncode = proc.returncode
+
     parts: list[str] = []
 
-    if result.stdout.strip():
-        parts.append(result.stdout.strip())
-    if result.stderr.strip():
-        parts.append(f"[stderr]\n{result.stderr.strip()}")
-    if result.returncode != 0:
-        parts.append(f"[exit code: {result.returncode}]")
+    stdout = out.text().strip()
+    if stdout:
+        parts.append(stdout)
+    stderr = err.text().strip()
+    if stderr:
+        parts.append(f"[stderr]\n{stderr}")
+    if returncode != 0:
+        parts.append(f"[exit code: {returncode}]")
 
     return "\n".join(parts) if parts else "(no output)"
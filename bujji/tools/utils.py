@@ -4,7 +4,7 @@ Utility tools: get_time, message (push notification to user).
 """
 from __future__ import annotations
 
-import datetime
+import time
 
 from bujji.tools.base import ToolContext, register_tool
 
@@ -13,8 +13,7 @@ from bujji.tools.base import ToolContext, register_tool
     parameters={"type": "object", "properties": {}},
 )
 def get_time(_ctx: ToolContext = None) -> str:
-    now = datetime.datetime.now()
-    return now.strftime("%A, %Y-%m-%d  %H:%M:%S  (local time)")
+    return time.strftime("%A, %Y-%m-%d  %H:%M:%S  (local time)", time.localtime())
 
 @register_tool(
     description=(
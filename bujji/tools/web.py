@@ -5,8 +5,23 @@ Setup
 ─────
 pip install ddgs
 """
+import threading
+
 from bujji.tools.base import ToolContext, param, register_tool
 
+# One DDGS client for the life of the process — keeps its HTTP connection
+# pool warm so repeat searches skip DNS + TCP + TLS setup.
+_ddgs      = None
+_ddgs_lock = threading.Lock()
+
+def _client():
+    global _ddgs
+    with _ddgs_lock:
+        if _ddgs is None:
+            from ddgs import DDGS
+            _ddgs = DDGS()
+        return _ddgs
+
 
 @register_tool(
     description=(
@@ -22,7 +37,7 @@ from bujji.tools.base import ToolContext, param, register_tool
 )
 def web_search(query: str, max_results: int = 5, _ctx: ToolContext = None) -> str:
     try:
-        from ddgs import DDGS
+        ddgs = _client()
     except ImportError:
         return (
             "[web_search] 'ddgs' is not installed.\n"
@@ -32,8 +47,7 @@ def web_search(query: str, max_results: int = 5, _ctx: ToolContext = None) -> st
     max_results = min(int(max_results), 20)
 
     try:
-        with DDGS() as ddgs:
-            results = list(ddgs.text(query, max_results=max_results))
+        results = list(ddgs.text(query, max_results=max_results))
     except Exception as e:
         return f"[Web Search Error] {e}"
 
@@ -18,32 +18,34 @@ Requirements:
 """
 
 import argparse
+import atexit
+import pathlib
 import sys
-import textwrap
-import threading
-import time
-
-from bujji          import LOGO, __version__
-from bujji.config   import (
-    CONFIG_FILE, POPULAR_MODELS, PROVIDER_DEFAULTS, WORKSPACE_DEFAULT,
-    get_active_provider, load_config, save_config, workspace_path,
-)
+
+# bujji/__init__ is import-cheap (no submodules).  Everything else is
+# imported inside the cmd_* that needs it, so each subcommand only pays
+# for its own dependencies.
+from bujji import LOGO, __version__
+
+
+def _has_module(name: str) -> bool:
+    """True if `name` is importable — without importing it (or its dependencies)."""
+    from importlib.util import find_spec
+    return find_spec(name) is not None
+
+
+def _require_requests() -> None:
+    # requests drags in urllib3, certifi, idna, charset_normalizer — only the
+    # code that actually makes HTTP calls should pay for that import.
+    if not _has_module("requests"):
+        sys.exit("ERROR: pip install requests")
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  ONBOARD
 # ─────────────────────────────────────────────────────────────────────────────
 
-def cmd_onboard(args) -> None:
-    print(f"\n{LOGO} Welcome to bujji v{__version__}\n")
-    cfg           = load_config()
-    provider_list = list(PROVIDER_DEFAULTS.keys())
-
-    print("Available LLM providers:")
-    for i, (p, (_, model)) in enumerate(PROVIDER_DEFAULTS.items(), 1):
-        print(f"  {i:2}. {p:<12}  default model: {model}")
-
-    print("""
+_API_KEY_HELP = """
   Get API keys:
     openrouter → https://openrouter.ai/keys            (all models, free tier)
     openai     → https://platform.openai.com/api-keys
@@ -51,12 +53,26 @@ def cmd_onboard(args) -> None:
     groq       → https://console.groq.com/keys         (free & fast)
     google     → https://aistudio.google.com/app/apikey   (Gemini, free tier)
     ollama     → (no key needed — runs locally)
-""")
+"""
+
+def cmd_onboard(args) -> None:
+    from bujji.config import (
+        CONFIG_FILE, POPULAR_MODEL_MENUS, PROVIDER_DEFAULTS, PROVIDER_LIST,
+        PROVIDER_MENU, WORKSPACE_DEFAULT, load_config, save_config,
+    )
+
+    cfg = load_config()
+
+    # Output between prompts goes out as one write per screenful
+    print(
+        f"\n{LOGO} Welcome to bujji v{__version__}\n\n"
+        f"Available LLM providers:\n{PROVIDER_MENU}\n{_API_KEY_HELP}"
+    )
 
     choice   = input("Choose provider number (Enter = openrouter): ").strip()
     provider = (
-        provider_list[int(choice) - 1]
-        if choice.isdigit() and 1 <= int(choice) <= len(provider_list)
+        PROVIDER_LIST[int(choice) - 1]
+        if choice.isdigit() and 1 <= int(choice) <= len(PROVIDER_LIST)
         else "openrouter"
     )
     print(f"\nSelected: {provider}")
@@ -67,48 +83,49 @@ def cmd_onboard(args) -> None:
 
     default_base, default_model = PROVIDER_DEFAULTS[provider]
 
-    if provider in POPULAR_MODELS:
-        print(f"\n  Popular {provider} models:")
-        for m in POPULAR_MODELS[provider]:
-            marker = "  ← default" if m == default_model else ""
-            print(f"    • {m}{marker}")
+    if provider in POPULAR_MODEL_MENUS:
+        print(f"\n  Popular {provider} models:\n{POPULAR_MODEL_MENUS[provider]}")
 
     model = input(f"\nModel name (Enter = {default_model}): ").strip() or default_model
 
-    cfg["providers"][provider] = {"api_key": api_key, "api_base": default_base}
-    cfg["agents"]["defaults"]["model"] = model
-
-    print("\n[Optional] Brave Search API key (https://brave.com/search/api)")
-    print("           Free tier: 2,000 queries/month")
-    brave = input("Brave API key (Enter to skip): ").strip()
-    if brave:
-        cfg["tools"]["web"]["search"]["api_key"] = brave
-
-    ws = input(f"\nWorkspace directory (Enter = {WORKSPACE_DEFAULT}): ").strip()
-    if ws:
-        cfg["agents"]["defaults"]["workspace"] = ws
-
-    # Telegram
-    print("\n" + "─" * 52)
-    print("  TELEGRAM SETUP  (optional — can be done later)")
-    print("─" * 52)
-    if input("Set up Telegram now? (y/N): ").strip().lower() == "y":
-        from bujji.connections.telegram import setup_telegram_interactive
-        setup_telegram_interactive(cfg)
-    else:
-        print("  [Skipped]  Run later:  python main.py setup-telegram")
+    # Provider + model are chosen — save exactly once from here on, even if
+    # the user bails out (Ctrl+C) partway through the optional steps.
+    try:
+        cfg["providers"][provider] = {"api_key": api_key, "api_base": default_base}
+        cfg["agents"]["defaults"]["model"] = model
+
+        print(
+            "\n[Optional] Brave Search API key (https://brave.com/search/api)\n"
+            "           Free tier: 2,000 queries/month"
+        )
+        brave = input("Brave API key (Enter to skip): ").strip()
+        if brave:
+            cfg["tools"]["web"]["search"]["api_key"] = brave
+
+        ws = input(f"\nWorkspace directory (Enter = {WORKSPACE_DEFAULT}): ").strip()
+        if ws:
+            cfg["agents"]["defaults"]["workspace"] = ws
+
+        # Telegram
+        print(f"\n{'─' * 52}\n  TELEGRAM SETUP  (optional — can be done later)\n{'─' * 52}")
+        if input("Set up Telegram now? (y/N): ").strip().lower() == "y":
+            from bujji.connections.telegram import setup_telegram_interactive
+            setup_telegram_interactive(cfg)
+        else:
+            print("  [Skipped]  Run later:  python main.py setup-telegram")
+    finally:
+        save_config(cfg)
 
-    save_config(cfg)
-    import pathlib
     ws_path = pathlib.Path(cfg["agents"]["defaults"]["workspace"]).expanduser()
-    ws_path.mkdir(parents=True, exist_ok=True)
-    (ws_path / "skills").mkdir(exist_ok=True)
+    (ws_path / "skills").mkdir(parents=True, exist_ok=True)   # creates ws_path too
     (ws_path / "cron").mkdir(exist_ok=True)
 
-    print(f"\n✅ Config:    {CONFIG_FILE}")
-    print(f"✅ Workspace: {ws_path}")
-    print(f"\n💡 Tip: Open the web UI for a nicer experience:")
-    print(f"   python main.py serve\n")
+    print(
+        f"\n✅ Config:    {CONFIG_FILE}\n"
+        f"✅ Workspace: {ws_path}\n"
+        f"\n💡 Tip: Open the web UI for a nicer experience:\n"
+        f"   python main.py serve\n"
+    )
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -116,15 +133,23 @@ def cmd_onboard(args) -> None:
 # ─────────────────────────────────────────────────────────────────────────────
 
 def cmd_serve(args) -> None:
-    try:
-        import requests  # noqa: F401
-    except ImportError:
-        sys.exit("ERROR: pip install requests")
+    _require_requests()
+
+    from bujji.config import get_active_provider, load_config
 
     cfg  = load_config()
     port = getattr(args, "port", 5168) or 5168
     host = getattr(args, "host", "127.0.0.1") or "127.0.0.1"
 
+    # Warm the provider connection while the server binds.  Just the LLM
+    # client — no tool discovery or skills — and it shares the pooled session.
+    pname, api_key, api_base, model = get_active_provider(cfg)
+    if pname:   # else: no provider yet — the web UI will prompt for one
+        import threading
+        from bujji.llm import LLMProvider
+        llm = LLMProvider(name=pname, api_key=api_key, api_base=api_base, model=model)
+        threading.Thread(target=llm.warmup, daemon=True).start()
+
     from bujji.server import run_server
     run_server(cfg, host=host, port=port)
 
@@ -222,7 +247,6 @@ def {first_tool}(query: str, limit: int = 10, _ctx: ToolContext = None) -> str:
 
 
 def cmd_new_tool(args) -> None:
-    import pathlib
     import re
 
     raw_name = args.name.strip().lower()
@@ -299,10 +323,14 @@ def cmd_new_tool(args) -> None:
 # ─────────────────────────────────────────────────────────────────────────────
 
 def cmd_setup_telegram(args) -> None:
+    from bujji.config import CONFIG_FILE, load_config, save_config
+
     cfg = load_config()
     print(f"\n{LOGO} Telegram Setup\n{'─'*52}")
     from bujji.connections.telegram import setup_telegram_interactive
-    setup_telegram_interactive(cfg)
+    if not setup_telegram_interactive(cfg):
+        print("\nNothing saved.\n")
+        return
     save_config(cfg)
     print(f"\n✅ Saved to {CONFIG_FILE}")
     print(f"Start the bot:  python main.py gateway\n")
@@ -312,14 +340,131 @@ def cmd_setup_telegram(args) -> None:
 #  AGENT
 # ─────────────────────────────────────────────────────────────────────────────
 
+class TokenSink:
+    """
+    Batches streamed tokens into few stdout writes.
+
+    print(t, flush=True) per token costs one write()+flush() syscall each;
+    here tokens collect in a byte buffer that is flushed once it holds
+    `max_bytes` or `max_delay` seconds have passed — still faster than the
+    eye can tell, so the reply keeps its streaming feel.
+    """
+
+    def __init__(self, max_bytes: int = 256, max_delay: float = 0.03):
+        from time import perf_counter
+        self.max_bytes  = max_bytes
+        self.max_delay  = max_delay
+        self._clock     = perf_counter
+        self._buf       = bytearray()
+        self._last      = perf_counter()
+        self._encoding  = sys.stdout.encoding or "utf-8"
+
+    def write(self, text: str) -> None:
+        self._buf += text.encode(self._encoding, errors="replace")
+        if (len(self._buf) >= self.max_bytes
+                or self._clock() - self._last >= self.max_delay):
+            self.flush()
+
+    def flush(self) -> None:
+        self._last = self._clock()
+        if not self._buf:
+            return
+        sys.stdout.flush()                 # keep ordering with earlier print()s
+        sys.stdout.buffer.write(self._buf)
+        sys.stdout.buffer.flush()
+        self._buf.clear()
+
+
+class StderrBatcher:
+    """
+    Coalesces tool-progress lines into few stderr writes.
+
+    A line is written at most `delay` seconds after it is queued, so a tool
+    call is announced while it runs; a fast tool's done line lands inside
+    that window and goes out in the same write as its start line.  One
+    flusher thread per batcher, started on first use, sleeping while idle.
+    """
+
+    def __init__(self, delay: float = 0.02):
+        import threading
+        import time
+        self.delay     = delay
+        self._clock    = time.monotonic
+        self._lines    = []
+        self._due      = None                  # flush deadline for queued lines
+        self._cond     = threading.Condition()
+        self._thread   = threading.Thread(target=self._run, daemon=True)
+        self._encoding = sys.stderr.encoding or "utf-8"
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._lines)
+
+    def write(self, line: str) -> None:
+        with self._cond:
+            if not self._thread.is_alive():
+                self._thread.start()
+            self._lines.append(line)
+            if self._due is None:
+                self._due = self._clock() + self.delay
+                self._cond.notify()
+
+    def flush(self) -> None:
+        with self._cond:
+            self._write_pending()
+
+    def _run(self) -> None:
+        with self._cond:
+            while True:
+                if self._due is None:
+                    self._cond.wait()            # idle: no wakeups
+                    continue
+                remaining = self._due - self._clock()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Write queued lines in one go.  Caller holds _cond (keeps writes ordered)."""
+        self._due = None
+        if not self._lines:
+            return
+        data = "".join(self._lines).encode(self._encoding, errors="replace")
+        self._lines.clear()
+        sys.stderr.flush()
+        sys.stderr.buffer.write(data)
+        sys.stderr.buffer.flush()
+
+
+def json_preview(args: dict, limit: int = 80) -> str:
+    """
+    One-line preview of tool args.  Long string values are clipped before
+    encoding, so a write_file carrying a whole file costs O(limit), not
+    O(file size).
+    """
+    import json
+    if isinstance(args, dict):
+        args = {k: v[:limit] if isinstance(v, str) else v for k, v in args.items()}
+    return json.dumps(args, ensure_ascii=False, default=str)[:limit]
+
+
+MAX_CONTEXT_MSGS = 10   # history messages sent per turn (last 5 exchanges)
+
+def _bound(history: list, cap: int = MAX_CONTEXT_MSGS) -> list:
+    """
+    Trim history to its most recent `cap` messages, keeping prompt size —
+    and so LLM latency and cost — constant as a session grows.
+    """
+    return history[-cap:]
+
+
 def cmd_agent(args) -> None:
-    try:
-        import requests  # noqa: F401
-    except ImportError:
-        sys.exit("ERROR: pip install requests")
+    _require_requests()
 
     try:
         from bujji.agent   import AgentLoop
+        from bujji.config  import load_config
         from bujji.session import SessionManager
         cfg = load_config()
         mgr = SessionManager(cfg)
@@ -329,15 +474,33 @@ def cmd_agent(args) -> None:
     stream     = not getattr(args, "no_stream", False)
     session_id = "cli"
 
-    import json
-    def json_preview(d):
-        return json.dumps(d, ensure_ascii=False)[:80]
+    sink = TokenSink()
+    err  = StderrBatcher()
+    atexit.register(sink.flush)
+    atexit.register(err.flush)
+
+    def on_token(t):
+        if err.pending:
+            err.flush()   # tool lines before the reply that follows them
+        sink.write(t)
+
+    def on_tool_start(n, a):
+        sink.flush()
+        err.write(f"\n{LOGO} [Tool] {n}({json_preview(a)})\n")
+
+    def on_tool_done(n, r):
+        err.write(f"  → {r[:120].replace(chr(10), ' ')}\n")
+
+    def on_error(e):
+        sink.flush()
+        err.write(f"\n[ERROR] {e}\n")
+        err.flush()
 
     callbacks = {
-        "on_token":      lambda t: print(t, end="", flush=True),
-        "on_tool_start": lambda n, a: print(f"\n{LOGO} [Tool] {n}({json_preview(a)})", file=sys.stderr),
-        "on_tool_done":  lambda n, r: print(f"  → {r[:120].replace(chr(10),' ')}", file=sys.stderr),
-        "on_error":      lambda e: print(f"\n[ERROR] {e}", file=sys.stderr),
+        "on_token":      on_token,
+        "on_tool_start": on_tool_start,
+        "on_tool_done":  on_tool_done,
+        "on_error":      on_error,
     }
 
     agent = mgr.get(session_id, callbacks=callbacks)
@@ -345,11 +508,39 @@ def cmd_agent(args) -> None:
     if args.message:
         print(f"\n{LOGO}: ", end="", flush=True)
         result = agent.run(args.message, stream=stream)
+        sink.flush()
         if result and not stream:
             print(result)
         print()
     else:
+        try:
+            import readline  # noqa: F401 — line editing + history for input()
+        except ImportError:
+            pass             # Windows: plain input()
+
+        # Write-behind history: SQLite commits happen while the user is
+        # typing the next message instead of delaying the next prompt.
+        import queue
+        import threading
+        write_q: queue.Queue = queue.Queue(maxsize=1024)
+
+        def _writer():
+            while True:
+                sid, role, content = write_q.get()
+                try:
+                    mgr.append(sid, role, content)
+                except Exception as e:   # e.g. DB locked / disk full — keep draining
+                    print(f"[WARN] Could not save history: {e}", file=sys.stderr)
+                finally:
+                    write_q.task_done()
+
+        threading.Thread(target=_writer, daemon=True).start()
+        atexit.register(write_q.join)
+
         print(f"\n{LOGO} Interactive mode  (Ctrl+C or /quit to exit, /clear to reset)\n")
+        resumed = len(mgr.history(session_id))   # "cli" history persists across runs
+        if resumed:
+            print(f"[Resuming previous session — {resumed} messages; /clear to start fresh]\n")
         while True:
             try:
                 user_input = input("You: ").strip()
@@ -358,20 +549,22 @@ def cmd_agent(args) -> None:
                 if user_input.lower() in ("/quit", "/exit", "quit", "exit"):
                     print(f"Bye! {LOGO}")
                     break
+                write_q.join()   # previous turn's history must be in first
                 if user_input.lower() == "/clear":
                     mgr.clear(session_id)
                     print("[History cleared]")
                     continue
 
                 print(f"\n{LOGO}: ", end="", flush=True)
-                history = mgr.history(session_id)
+                history = _bound(mgr.history(session_id))
                 result  = agent.run(user_input, history=history, stream=stream)
+                sink.flush()
                 if not stream and result:
                     print(result)
                 print()
 
-                mgr.append(session_id, "user",      user_input)
-                mgr.append(session_id, "assistant", result or "[streamed]")
+                write_q.put((session_id, "user",      user_input))
+                write_q.put((session_id, "assistant", result or "[streamed]"))
 
             except (KeyboardInterrupt, EOFError):
                 print(f"\n\nBye! {LOGO}")
@@ -383,13 +576,14 @@ def cmd_agent(args) -> None:
 # ─────────────────────────────────────────────────────────────────────────────
 
 def cmd_gateway(args) -> None:
-    try:
-        import requests  # noqa: F401
-    except ImportError:
-        sys.exit("ERROR: pip install requests")
+    import signal
+    import threading
+
+    _require_requests()
 
     try:
         from bujji.agent   import AgentLoop, HeartbeatService, CronService
+        from bujji.config  import load_config, workspace_path
         from bujji.session import SessionManager
         cfg = load_config()
         mgr = SessionManager(cfg)
@@ -401,11 +595,16 @@ def cmd_gateway(args) -> None:
     channels_cfg = cfg.get("channels", {})
     active       = []
 
+    # Connect to the provider while channels start up
+    threading.Thread(target=agent.warmup, daemon=True).start()
+
     hb   = HeartbeatService(agent, ws)
     cron = CronService(agent, ws)
     hb.start()
     cron.start()
 
+    # Channel modules (and their client libraries) are only imported when the
+    # channel is enabled; a missing library skips that channel with a hint.
     tg_cfg = channels_cfg.get("telegram", {})
     if tg_cfg.get("enabled") and tg_cfg.get("token"):
         from bujji.connections.telegram import TelegramChannel
@@ -415,10 +614,14 @@ def cmd_gateway(args) -> None:
 
     dc_cfg = channels_cfg.get("discord", {})
     if dc_cfg.get("enabled") and dc_cfg.get("token"):
-        from bujji.connections.discord import DiscordChannel
-        dc = DiscordChannel(dc_cfg["token"], dc_cfg.get("allow_from", []), cfg, mgr)
-        threading.Thread(target=dc.run, daemon=True).start()
-        active.append("Discord")
+        if not _has_module("discord"):   # checks without importing aiohttp & co.
+            print("[WARN] Discord enabled but discord.py not installed — pip install discord.py",
+                  file=sys.stderr)
+        else:
+            from bujji.connections.discord import DiscordChannel
+            dc = DiscordChannel(dc_cfg["token"], dc_cfg.get("allow_from", []), cfg, mgr)
+            threading.Thread(target=dc.run, daemon=True).start()
+            active.append("Discord")
 
     if not active:
         print(f"\n{LOGO} No channels enabled.  Run: python main.py setup-telegram")
@@ -428,12 +631,21 @@ def cmd_gateway(args) -> None:
     print(f"\n{LOGO} Gateway running.  Channels: {', '.join(active)}")
     print("Press Ctrl+C to stop.\n")
 
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        print(f"\n{LOGO} Shutting down…")
-        hb.stop(); cron.stop()
+    # Block in the kernel until Ctrl+C / SIGTERM — no periodic wakeups
+    stop_evt = threading.Event()
+    for name in ("SIGINT", "SIGTERM", "SIGBREAK"):   # SIGBREAK: Ctrl+Break on Windows
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), lambda *_: stop_evt.set())
+    if sys.platform == "win32":
+        # An untimed wait can't be interrupted by Ctrl+C/Ctrl+Break on
+        # Windows (bpo-29971) — wake once a second so the handlers can run.
+        while not stop_evt.wait(1):
+            pass
+    else:
+        stop_evt.wait()
+
+    print(f"\n{LOGO} Shutting down…")
+    hb.stop(); cron.stop()
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -441,82 +653,144 @@ def cmd_gateway(args) -> None:
 # ─────────────────────────────────────────────────────────────────────────────
 
 def cmd_status(args) -> None:
-    import json
+    from bujji.config     import CONFIG_FILE, get_active_provider, load_config, workspace_path
+    from bujji.tool_cache import load_tool_schema
+
     cfg                             = load_config()
     pname, api_key, api_base, model = get_active_provider(cfg)
     ws                              = workspace_path(cfg)
 
-    print(f"\n{LOGO} bujji v{__version__}")
-    print(f"  Config:    {CONFIG_FILE}  {'✅' if CONFIG_FILE.exists() else '❌ missing'}")
-    print(f"  Workspace: {ws}  {'✅' if ws.exists() else '❌ missing'}")
+    # Collect every line and emit with a single write — no per-line flush
+    out: list[str] = []
+    out.append(f"\n{LOGO} bujji v{__version__}")
+    out.append(f"  Config:    {CONFIG_FILE}  {'✅' if CONFIG_FILE.exists() else '❌ missing'}")
+    out.append(f"  Workspace: {ws}  {'✅' if ws.exists() else '❌ missing'}")
 
-    print(f"\n  LLM Provider:")
+    out.append(f"\n  LLM Provider:")
     if pname:
         masked = (api_key[:6] + "…") if api_key and len(api_key) > 6 else "(set)"
-        print(f"    Provider : {pname}")
-        print(f"    Model    : {model}")
-        print(f"    API Base : {api_base}")
-        print(f"    Key      : {masked}")
+        out.append(f"    Provider : {pname}")
+        out.append(f"    Model    : {model}")
+        out.append(f"    API Base : {api_base}")
+        out.append(f"    Key      : {masked}")
     else:
-        print(f"    ⚠️  Not configured — run: python main.py onboard")
+        out.append(f"    ⚠️  Not configured — run: python main.py onboard")
 
-    print(f"\n  Channels:")
+    out.append(f"\n  Channels:")
     for ch_name, ch_cfg in cfg.get("channels", {}).items():
         enabled = ch_cfg.get("enabled", False)
-        print(f"    {'✅' if enabled else '  '} {ch_name}")
+        out.append(f"    {'✅' if enabled else '  '} {ch_name}")
 
     brave = cfg["tools"]["web"]["search"].get("api_key", "")
-    print(f"\n  Web search : {'✅ Brave API configured' if brave else '  not configured'}")
+    out.append(f"\n  Web search : {'✅ Brave API configured' if brave else '  not configured'}")
 
     try:
-        from bujji.tools import ToolRegistry
-        registry   = ToolRegistry(cfg)
-        tool_names = [s["function"]["name"] for s in registry.schema()]
-        print(f"\n  Tools ({len(tool_names)}): {', '.join(tool_names)}")
+        schema = load_tool_schema()   # skips importing every tool module
+        if schema is None:
+            from bujji.tools import ToolRegistry
+            schema = ToolRegistry(cfg).schema()
+        tool_names = [s["function"]["name"] for s in schema]
+        out.append(f"\n  Tools ({len(tool_names)}): {', '.join(tool_names)}")
     except Exception as e:
-        print(f"\n  Tools: (error — {e})")
+        out.append(f"\n  Tools: (error — {e})")
 
-    print(f"\n  Python : {sys.version.split()[0]}")
-    try:
-        import requests  # noqa
-        print(f"  requests : ✅\n")
-    except ImportError:
-        print(f"  requests : ❌  pip install requests\n")
+    out.append(f"\n  Python : {sys.version.split()[0]}")
+    if _has_module("requests"):
+        out.append(f"  requests : ✅\n")
+    else:
+        out.append(f"  requests : ❌  pip install requests\n")
 
-    print(f"  Web UI : python main.py serve  → http://localhost:7337\n")
+    out.append(f"  Web UI : python main.py serve  → http://localhost:7337\n")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  ENTRY POINT
 # ─────────────────────────────────────────────────────────────────────────────
 
-def main() -> None:
+# Already dedented — no textwrap import needed at startup
+_EPILOG = """
+examples:
+  python main.py onboard                        # first-time setup
+  python main.py serve                          # web UI (recommended)
+  python main.py agent -m "What's my disk usage?"
+  python main.py agent                          # interactive chat
+  python main.py new-tool weather               # scaffold a new tool
+  python main.py new-tool github                # scaffold github tool
+  python main.py gateway                        # Telegram / Discord bot
+"""
+
+# Every subcommand's handler and option defaults — the single source for both
+# the argparse tree (set_defaults) and the _fast_args Namespace.
+_COMMANDS = {
+    "onboard":        (cmd_onboard,        {}),
+    "setup-telegram": (cmd_setup_telegram, {}),
+    "serve":          (cmd_serve,          {"port": 7337, "host": "127.0.0.1"}),
+    "agent":          (cmd_agent,          {"message": None, "no_stream": False}),
+    "new-tool":       (cmd_new_tool,       {}),
+    "gateway":        (cmd_gateway,        {}),
+    "status":         (cmd_status,         {}),
+}
+
+
+def _fast_args(argv: list[str]):
+    """
+    Hand-parse the common invocations (`agent -m "..."`, `status`, …) into the
+    same Namespace argparse would build, skipping parser construction.
+    Returns None for anything unusual — help, --version, unknown flags —
+    so the full argparse path handles it (and its error messages).
+    """
+    if not argv or argv[0] not in _COMMANDS:
+        return None
+    command, rest = argv[0], argv[1:]
+    if any(a in ("-h", "--help") for a in rest):
+        return None
+    func, defaults = _COMMANDS[command]
+    ns = argparse.Namespace(command=command, func=func, **defaults)
+
+    if command == "agent":
+        it = iter(rest)
+        for a in it:
+            if a in ("-m", "--message"):
+                ns.message = next(it, None)
+                if ns.message is None or ns.message.startswith("-"):
+                    return None
+            elif a.startswith("--message="):
+                ns.message = a.split("=", 1)[1]
+            elif a == "--no-stream":
+                ns.no_stream = True
+            else:
+                return None
+        return ns
+
+    if command == "new-tool":
+        if len(rest) != 1 or rest[0].startswith("-"):
+            return None
+        ns.name = rest[0]
+        return ns
+
+    return None if rest else ns
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="bujji",
         description=f"{LOGO} bujji  — Ultra-lightweight AI assistant",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=textwrap.dedent("""
-  examples:
-    python main.py onboard                        # first-time setup
-    python main.py serve                          # web UI (recommended)
-    python main.py agent -m "What's my disk usage?"
-    python main.py agent                          # interactive chat
-    python main.py new-tool weather               # scaffold a new tool
-    python main.py new-tool github                # scaffold github tool
-    python main.py gateway                        # Telegram / Discord bot
-        """),
+        epilog=_EPILOG,
     )
     parser.add_argument("--version", action="version", version=f"bujji {__version__}")
-    sub = parser.add_subparsers(dest="command")
+    sub = parser.add_subparsers(dest="command", required=True)
 
     sub.add_parser("onboard",        help="First-time setup wizard")
     sub.add_parser("setup-telegram", help="Configure the Telegram bot")
     sub.add_parser("gateway",        help="Start Telegram / Discord gateway")
     sub.add_parser("status",         help="Show config and runtime status")
 
-    p_serve = sub.add_parser("serve", help="Open web UI in browser (http://localhost:7337)")
-    p_serve.add_argument("--port", type=int, default=7337)
-    p_serve.add_argument("--host", type=str, default="127.0.0.1")
+    serve_port = _COMMANDS["serve"][1]["port"]
+    p_serve = sub.add_parser("serve", help=f"Open web UI in browser (http://localhost:{serve_port})")
+    p_serve.add_argument("--port", type=int)
+    p_serve.add_argument("--host", type=str)
 
     p_agent = sub.add_parser("agent", help="Chat with the agent in the terminal")
     p_agent.add_argument("-m", "--message", type=str, metavar="TEXT")
@@ -533,22 +807,17 @@ def main() -> None:
         help="Service name for the tool, e.g. 'weather', 'github', 'linear'",
     )
 
-    args = parser.parse_args()
+    # Handlers + option defaults come from _COMMANDS (parser-level defaults
+    # override the argument-level ones)
+    for name, (func, defaults) in _COMMANDS.items():
+        sub.choices[name].set_defaults(func=func, **defaults)
+    return parser
 
-    cmds = {
-        "onboard":        cmd_onboard,
-        "setup-telegram": cmd_setup_telegram,
-        "serve":          cmd_serve,
-        "agent":          cmd_agent,
-        "new-tool":       cmd_new_tool,
-        "gateway":        cmd_gateway,
-        "status":         cmd_status,
-    }
 
-    if args.command in cmds:
-        cmds[args.command](args)
-    else:
-        parser.print_help()
+def main() -> None:
+    # Fast path: plain subcommand invocations never build the argparse tree
+    args = _fast_args(sys.argv[1:]) or _build_parser().parse_args()
+    args.func(args)
 
 
 if __name__ == "__main__":